@@ -1,5 +1,7 @@
 from collections import deque
+import heapq
 import networkx as nx
+import numpy as np
 import random
 from typing import Dict, Generator, List, Optional, Tuple
 
@@ -8,39 +10,35 @@ from bgpsecsim.asys import AS, AS_ID, Relation, Route, RoutingPolicy
 from bgpsecsim.routing_policy import DefaultPolicy
 
 def parse_as_rel_file(filename: str) -> nx.Graph:
-    with open(filename, 'r') as f:
-        graph = nx.Graph()
-
-        for line in f:
-            # Ignore lines starting with #
-            if line.startswith('#'):
-                continue
-
-            # The 'serial-1' as-rel files contain p2p and p2c relationships. The format is:
-            # <provider-as>|<customer-as>|-1
-            # <peer-as>|<peer-as>|0
-            items = line.split('|')
-            if len(items) != 3:
-                raise error.InvalidASRelFile(filename, f"bad line: {line}")
-
-            [as1, as2, rel] = map(int, items)
-            if as1 not in graph:
-                graph.add_node(as1)
-            if as2 not in graph:
-                graph.add_node(as2)
-
-            customer = as2 if rel == -1 else None
-            graph.add_edge(as1, as2, customer=customer)
+    # The 'serial-1' as-rel files contain p2p and p2c relationships. The format is:
+    # <provider-as>|<customer-as>|-1
+    # <peer-as>|<peer-as>|0
+    # Lines starting with # are comments. np.loadtxt parses the whole file in one C-level pass
+    # rather than splitting and converting each line in the interpreter.
+    try:
+        rows = np.loadtxt(filename, dtype=np.int64, delimiter='|', comments='#', ndmin=2)
+    except ValueError as err:
+        raise error.InvalidASRelFile(filename, str(err))
+    if rows.size > 0 and rows.shape[1] != 3:
+        raise error.InvalidASRelFile(filename, f"expected 3 fields per line, got {rows.shape[1]}")
 
+    graph = nx.Graph()
+    graph.add_edges_from(
+        (as1, as2, {'customer': as2 if rel == -1 else None})
+        for as1, as2, rel in rows.tolist())
     return graph
 
 class ASGraph(object):
-    __slots__ = ['asyss', 'graph']
+    __slots__ = ['asyss', 'graph', '_reach_graph', '_asys_tuple']
 
     asyss: Dict[AS_ID, AS]
+    _reach_graph: Optional[Tuple[nx.DiGraph, Dict[AS_ID, int]]]
+    _asys_tuple: Optional[Tuple[AS, ...]]
 
     def __init__(self, graph: nx.Graph, policy: RoutingPolicy = DefaultPolicy()):
         self.asyss = {}
+        self._reach_graph = None
+        self._asys_tuple = None
         for as_id in graph.nodes:
             self.asyss[as_id] = AS(as_id, policy)
         for (as_id1, as_id2) in graph.edges:
@@ -62,10 +60,8 @@ class ASGraph(object):
 
     def identify_top_isps(self, n: int) -> List[AS]:
         """Top ISPs by customer degree."""
-        isps = [(asys, asys.neighbor_counts_by_relation())
-                for asys in self.asyss.values()]
-        isps.sort(key=lambda pair: -pair[1][Relation.CUSTOMER])
-        return [asys for asys, _ in isps[:n]]
+        return heapq.nlargest(n, self.asyss.values(),
+                              key=lambda asys: asys.neighbor_counts_by_relation()[Relation.CUSTOMER])
 
     def get_providers(self, ids: List[AS_ID]) -> List[AS]:
         """Return providers of a list of ASes, as a set"""
@@ -77,52 +73,108 @@ class ASGraph(object):
 
     def determine_reachability_one(self, as_id: AS_ID) -> int:
         """Returns how many ASs can the given AS, itself included."""
-        graph = self._build_reachability_graph()
-        n_ancestors = len([as_id
-                           for side, as_id in nx.ancestors(graph, ('r', as_id))
-                           if side == 'l'])
+        graph, index = self._build_reachability_graph()
+        # Reverse BFS from the right-side node, counting left-side nodes as they are discovered
+        # rather than materializing the full ancestor set with nx.ancestors.
+        pred = graph.pred
+        target = 2 * index[as_id] + 1
+        visited = {target}
+        fringe = [target]
+        n_ancestors = 0
+        while fringe:
+            next_fringe = []
+            for node in fringe:
+                for prev_node in pred[node]:
+                    if prev_node not in visited:
+                        visited.add(prev_node)
+                        if prev_node & 1 == 0:
+                            n_ancestors += 1
+                        next_fringe.append(prev_node)
+            fringe = next_fringe
         return n_ancestors
 
     def determine_reachability_all(self) -> Dict[AS_ID, int]:
         """Returns how many ASs can reach each AS, themselves included."""
-        graph = self._build_reachability_graph()
-
-        # Process nodes in topological order, keeping track of which ones they are reachable from
-        # with a bitfield.
-        queue: deque = deque()
-        remaining_edges = {}
-        for node in graph:
-            remaining_edges[node] = graph.in_degree(node)
-            if remaining_edges[node] == 0:
-                del remaining_edges[node]
-                queue.append(node)
-        while queue:
-            node = queue.popleft()
-            for next_node in graph.successors(node):
-                graph.nodes[next_node]['reachable_from'] |= graph.nodes[node]['reachable_from']
-                remaining_edges[next_node] -= 1
-                if remaining_edges[next_node] == 0:
-                    del remaining_edges[next_node]
-                    queue.append(next_node)
-
-        return { as_id: bit_count(graph.nodes[('r', as_id)]['reachable_from'])
-                 for as_id in self.asyss }
-
-    def _build_reachability_graph(self) -> nx.DiGraph:
+        # Same left/right node construction as _build_reachability_graph, but with ASs mapped to
+        # dense indices: node 2i is the left copy of AS i, node 2i + 1 the right copy. The
+        # reachable-from sets are rows of a bit-packed uint64 matrix rather than Python bigints,
+        # so ORing one set into another is a single vectorized operation over N/64 words.
+        asyss = list(self.asyss.values())
+        n = len(asyss)
+        index = { asys.as_id: i for i, asys in enumerate(asyss) }
+
+        successors: List[List[int]] = [[] for _ in range(2 * n)]
+        in_degree = [0] * (2 * n)
+        for i, asys in enumerate(asyss):
+            successors[2 * i].append(2 * i + 1)
+            in_degree[2 * i + 1] += 1
+            for neighbor, relation in asys.neighbors.items():
+                j = index[neighbor.as_id]
+                if relation == Relation.CUSTOMER:
+                    successors[2 * i + 1].append(2 * j + 1)
+                    in_degree[2 * j + 1] += 1
+                elif relation == Relation.PEER:
+                    successors[2 * i].append(2 * j + 1)
+                    in_degree[2 * j + 1] += 1
+                elif relation == Relation.PROVIDER:
+                    successors[2 * i].append(2 * j)
+                    in_degree[2 * j] += 1
+
+        reach = np.zeros((2 * n, (n + 63) // 64), dtype=np.uint64)
+        bits = np.arange(n)
+        reach[2 * bits, bits >> 6] = np.uint64(1) << (bits & 63).astype(np.uint64)
+
+        # Process nodes in topological order, ORing reachable-from rows into successors. Each
+        # node is enqueued exactly once, so a flat preallocated array with head/tail cursors
+        # serves as the queue and the in-degrees live in a flat int32 array.
+        remaining = np.asarray(in_degree, dtype=np.int32)
+        queue = np.empty(2 * n, dtype=np.int32)
+        ready = np.nonzero(remaining == 0)[0]
+        tail = len(ready)
+        queue[:tail] = ready
+        head = 0
+        while head < tail:
+            node = queue[head]
+            head += 1
+            row = reach[node]
+            for next_node in successors[node]:
+                reach[next_node] |= row
+                remaining[next_node] -= 1
+                if remaining[next_node] == 0:
+                    queue[tail] = next_node
+                    tail += 1
+
+        counts = matrix_bit_counts(reach[1::2])
+        return { asys.as_id: int(counts[i]) for i, asys in enumerate(asyss) }
+
+    def _build_reachability_graph(self) -> Tuple[nx.DiGraph, Dict[AS_ID, int]]:
+        # The graph is purely structural, so it can be built once and reused across reachability
+        # queries. The AS topology is fixed after construction, so the cache is never invalidated.
+        #
+        # Nodes are ints packed from dense AS indices: node 2i is the left copy of AS i and node
+        # 2i + 1 the right copy, the same layout as determine_reachability_all. Int keys avoid
+        # the ('l', as_id) tuple objects and their hashing on every adjacency access.
+        if self._reach_graph is not None:
+            return self._reach_graph
+
+        index = { as_id: i for i, as_id in enumerate(self.asyss) }
         graph = nx.DiGraph()
         for asys in self.asyss.values():
-            graph.add_node(('l', asys.as_id), reachable_from=(1 << asys.as_id))
-            graph.add_node(('r', asys.as_id), reachable_from=0)
-            graph.add_edge(('l', asys.as_id), ('r', asys.as_id))
+            i = index[asys.as_id]
+            graph.add_edge(2 * i, 2 * i + 1)
         for asys in self.asyss.values():
+            i = index[asys.as_id]
             for neighbor, relation in asys.neighbors.items():
+                j = index[neighbor.as_id]
                 if relation == Relation.CUSTOMER:
-                    graph.add_edge(('r', asys.as_id), ('r', neighbor.as_id))
+                    graph.add_edge(2 * i + 1, 2 * j + 1)
                 elif relation == Relation.PEER:
-                    graph.add_edge(('l', asys.as_id), ('r', neighbor.as_id))
+                    graph.add_edge(2 * i, 2 * j + 1)
                 elif relation == Relation.PROVIDER:
-                    graph.add_edge(('l', asys.as_id), ('l', neighbor.as_id))
-        return graph
+                    graph.add_edge(2 * i, 2 * j)
+
+        self._reach_graph = (graph, index)
+        return self._reach_graph
 
     def any_customer_provider_cycles(self) -> bool:
         graph = nx.DiGraph()
@@ -142,14 +194,21 @@ class ASGraph(object):
         routes: deque = deque()
         for neighbor in target.neighbors:
             routes.append(target.originate_route(neighbor))
+        self._propagate_routes(routes)
 
-        while routes:
-            route = routes.popleft()
-            asys = route.final
-            for neighbor in asys.learn_route(route):
-                routes.append(asys.forward_route(route, neighbor))
+    def hijack_n_hops(
+            self,
+            victim: AS,
+            attacker: AS,
+            n: int,
+            rng: Optional[random.Random] = None
+    ) -> None:
+        # Drawing from an explicit random.Random keeps Monte Carlo sweeps reproducible per
+        # experiment and avoids contending on the module-global RNG; the default remains the
+        # module-global RNG so existing seeding behavior is unchanged.
+        sample = rng.sample if rng is not None else random.sample
+        choice = rng.choice if rng is not None else random.choice
 
-    def hijack_n_hops(self, victim: AS, attacker: AS, n: int) -> None:
         if n < 0:
             raise ValueError("number of hops must be non-negative")
         elif n == 0:
@@ -157,8 +216,20 @@ class ASGraph(object):
         elif n == 1:
             path = [victim, attacker]
         else:
-            asyss = list(set(self.asyss.values()) - set([victim, attacker]))
-            middle = random.sample(asyss, n - 1)
+            if self._asys_tuple is None:
+                self._asys_tuple = tuple(self.asyss.values())
+            population = self._asys_tuple
+            if n + 1 > len(population):
+                raise ValueError("number of hops exceeds graph size")
+            # Sample with two spare draws and reject victim/attacker, rather than rebuilding the
+            # population without them on every attack.
+            middle = [asys
+                      for asys in sample(population, min(n + 1, len(population)))
+                      if asys is not victim and asys is not attacker][:n - 1]
+            while len(middle) < n - 1:
+                extra = choice(population)
+                if extra is not victim and extra is not attacker and extra not in middle:
+                    middle.append(extra)
             path = [victim] + middle + [attacker]
 
         bad_route = Route(
@@ -172,15 +243,55 @@ class ASGraph(object):
         routes: deque = deque()
         for neighbor in attacker.neighbors:
             routes.append(attacker.forward_route(bad_route, neighbor))
+        self._propagate_routes(routes)
 
+    def _propagate_routes(self, routes: deque) -> None:
+        # This loop runs once per learned route across the whole graph and dominates experiment
+        # time, so keep the per-iteration interpreter work minimal: bind the queue methods once
+        # and avoid any temporaries beyond the forwarded routes themselves.
+        popleft = routes.popleft
+        append = routes.append
         while routes:
-            route = routes.popleft()
+            route = popleft()
             asys = route.final
-            for neighbor in asys.learn_route(route):
-                routes.append(asys.forward_route(route, neighbor))
+            neighbors = asys.learn_route(route)
+            if neighbors:
+                forward_route = asys.forward_route
+                for neighbor in neighbors:
+                    append(forward_route(route, neighbor))
+
+def popcount_u64(x: np.ndarray) -> np.ndarray:
+    """Per-element popcount of a uint64 array, as a tree of adders (Wilkes-Wheeler-Gill).
+
+    Five vectorized operations per word, versus eight unpacked bytes per word with
+    np.unpackbits.
+    """
+    c1 = np.uint64(0x5555555555555555)
+    c2 = np.uint64(0x3333333333333333)
+    c4 = np.uint64(0x0F0F0F0F0F0F0F0F)
+    h01 = np.uint64(0x0101010101010101)
+    x = x - ((x >> np.uint64(1)) & c1)
+    x = (x & c2) + ((x >> np.uint64(2)) & c2)
+    x = (x + (x >> np.uint64(4))) & c4
+    return (x * h01) >> np.uint64(56)
+
+def matrix_bit_counts(matrix: np.ndarray) -> np.ndarray:
+    """Number of set bits in each row of a uint64 matrix."""
+    if hasattr(np, 'bitwise_count'):  # NumPy 2.0+
+        return np.bitwise_count(matrix).sum(axis=1, dtype=np.int64)
+    return popcount_u64(matrix).sum(axis=1, dtype=np.int64)
 
-def bit_count(bitfield: int) -> int:
-    return bin(bitfield).count('1')
+try:
+    # GMP's popcount runs a tight unrolled loop over the limb array and wins on very wide
+    # bitfields, but gmpy2 is an optional extra.
+    from gmpy2 import popcount as bit_count  # type: ignore
+except ImportError:
+    if hasattr(int, 'bit_count'):
+        # Python 3.10+ popcount, implemented natively on the digit array.
+        bit_count = int.bit_count
+    else:
+        def bit_count(bitfield: int) -> int:
+            return bin(bitfield).count('1')
 
 def asyss_by_customer_count(
         graph: nx.Graph,
@@ -1,6 +1,6 @@
 import abc
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 AS_ID = int
 
@@ -12,7 +12,7 @@ class Relation(Enum):
 class AS(object):
     __slots__ = [
         'as_id', 'neighbors', 'policy', 'publishes_rpki', 'publishes_path_end', 'bgp_sec_enabled',
-        'routing_table'
+        'routing_table', '_rel_counts', '_providers', '_neighbors_by_relation'
     ]
 
     as_id: AS_ID
@@ -38,26 +38,51 @@ class AS(object):
         self.publishes_path_end = publishes_path_end
         self.bgp_sec_enabled = bgp_sec_enabled
         self.routing_table = {}
+        self._rel_counts: Optional[Dict[Relation, int]] = None
+        self._providers: Optional[List[AS_ID]] = None
+        self._neighbors_by_relation: Optional[Dict[Relation, Tuple['AS', ...]]] = None
         self.reset_routing_table()
 
     def neighbor_counts_by_relation(self) -> Dict[Relation, int]:
-        counts = { relation: 0 for relation in Relation }
-        for relation in self.neighbors.values():
-            counts[relation] += 1
-        return counts
-        
+        if self._rel_counts is None:
+            counts = { relation: 0 for relation in Relation }
+            for relation in self.neighbors.values():
+                counts[relation] += 1
+            self._rel_counts = counts
+        return self._rel_counts
+
     def get_providers(self) -> List[AS_ID]:
-        providers = filter(lambda id: self.neighbors[id] == Relation.PROVIDER, self.neighbors.keys())
-        return [p.as_id for p in providers]
-        
+        if self._providers is None:
+            self._providers = [neighbor.as_id
+                               for neighbor, relation in self.neighbors.items()
+                               if relation == Relation.PROVIDER]
+        return self._providers
+
     def add_peer(self, asys: 'AS') -> None:
         self.neighbors[asys] = Relation.PEER
+        self._invalidate_neighbor_caches()
 
     def add_customer(self, asys: 'AS') -> None:
         self.neighbors[asys] = Relation.CUSTOMER
+        self._invalidate_neighbor_caches()
 
     def add_provider(self, asys: 'AS') -> None:
         self.neighbors[asys] = Relation.PROVIDER
+        self._invalidate_neighbor_caches()
+
+    def _invalidate_neighbor_caches(self) -> None:
+        self._rel_counts = None
+        self._providers = None
+        self._neighbors_by_relation = None
+
+    def neighbors_by_relation(self) -> Dict[Relation, Tuple['AS', ...]]:
+        if self._neighbors_by_relation is None:
+            groups: Dict[Relation, List['AS']] = { relation: [] for relation in Relation }
+            for neighbor, relation in self.neighbors.items():
+                groups[relation].append(neighbor)
+            self._neighbors_by_relation = { relation: tuple(group)
+                                            for relation, group in groups.items() }
+        return self._neighbors_by_relation
 
     def get_relation(self, asys: 'AS') -> Optional[Relation]:
         return self.neighbors.get(asys, None)
@@ -85,13 +110,13 @@ class AS(object):
 
         self.routing_table[route.dest] = route
 
-        forward_to_relations = set((relation
-                                    for relation in Relation
-                                    if self.policy.forward_to(route, relation)))
-
-        return [neighbor
-                for neighbor, relation in self.neighbors.items()
-                if relation in forward_to_relations]
+        # Neighbors are pre-grouped by relation, so forwarding targets are concatenated from the
+        # matching groups rather than filtering the whole neighbor dict per learned route.
+        groups = self.neighbors_by_relation()
+        forward_to: List['AS'] = []
+        for relation in self.policy.forward_to_relations(route):
+            forward_to.extend(groups[relation])
+        return forward_to
 
     def originate_route(self, next_hop: 'AS') -> 'Route':
         return Route(
@@ -103,11 +128,9 @@ class AS(object):
         )
 
     def forward_route(self, route: 'Route', next_hop: 'AS') -> 'Route':
-        return Route(
-            dest=route.dest,
-            path=route.path + [next_hop],
-            origin_invalid=route.origin_invalid,
-            path_end_invalid=route.path_end_invalid,
+        return Route.extend(
+            route,
+            next_hop,
             authenticated=route.authenticated and next_hop.bgp_sec_enabled,
         )
 
@@ -121,19 +144,26 @@ class AS(object):
             authenticated=True,
         )
 
+# Route flag bits, packed into a single int slot rather than one bool attribute each.
+FLAG_ORIGIN_INVALID = 1
+FLAG_PATH_END_INVALID = 2
+FLAG_AUTHENTICATED = 4
+FLAG_CONTAINS_CYCLE = 8
+
 class Route(object):
-    __slots__ = ['dest', 'path', 'origin_invalid', 'path_end_invalid', 'authenticated']
+    __slots__ = ['dest', 'prev', 'last_hop', '_path', 'length', 'origin', 'flags']
 
     # Destination is an IP block that is owned by this AS. The AS_ID is the same as the origin's ID
     # for valid routes, but may differ in a hijacking attack.
     dest: AS_ID
-    path: List[AS]
-    # Whether the origin has no valid RPKI record and one is expected.
-    origin_invalid: bool
-    # Whether the first hop has no valid path-end record and one is expected.
-    path_end_invalid: bool
-    # Whether the path is authenticated with BGPsec.
-    authenticated: bool
+    # Routes share path prefixes with the routes they were forwarded from, so a forwarded route
+    # stores only its last hop plus a link to the previous route instead of copying the full path.
+    prev: Optional['Route']
+    last_hop: AS
+    _path: Optional[Tuple[AS, ...]]
+    length: int
+    origin: AS
+    flags: int
 
     def __init__(
         self,
@@ -144,29 +174,90 @@ class Route(object):
         authenticated: bool,
     ):
         self.dest = dest
-        self.path = path
-        self.origin_invalid = origin_invalid
-        self.path_end_invalid = path_end_invalid
-        self.authenticated = authenticated
+        self.prev = None
+        self.last_hop = path[-1]
+        self._path = tuple(path)
+        self.length = len(path)
+        self.origin = path[0]
+        flags = 0
+        if origin_invalid:
+            flags |= FLAG_ORIGIN_INVALID
+        if path_end_invalid:
+            flags |= FLAG_PATH_END_INVALID
+        if authenticated:
+            flags |= FLAG_AUTHENTICATED
+        if len(path) != len(set(path)):
+            flags |= FLAG_CONTAINS_CYCLE
+        self.flags = flags
+
+    @classmethod
+    def extend(cls, route: 'Route', next_hop: AS, authenticated: bool) -> 'Route':
+        """A copy of route with next_hop appended to the path, sharing the path prefix."""
+        new = cls.__new__(cls)
+        new.dest = route.dest
+        new.prev = route
+        new.last_hop = next_hop
+        new._path = None
+        new.length = route.length + 1
+        new.origin = route.origin
+        flags = route.flags & ~FLAG_AUTHENTICATED
+        if authenticated:
+            flags |= FLAG_AUTHENTICATED
+        # The extended route has a cycle iff the base route did or next_hop is already on its
+        # path, so a single scan at construction replaces hashing the path on every check.
+        if not flags & FLAG_CONTAINS_CYCLE:
+            node = route
+            while node._path is None:
+                if node.last_hop is next_hop:
+                    flags |= FLAG_CONTAINS_CYCLE
+                    break
+                assert node.prev is not None
+                node = node.prev
+            else:
+                if next_hop in node._path:
+                    flags |= FLAG_CONTAINS_CYCLE
+        new.flags = flags
+        return new
 
     @property
-    def length(self) -> int:
-        return len(self.path)
+    def origin_invalid(self) -> bool:
+        """Whether the origin has no valid RPKI record and one is expected."""
+        return bool(self.flags & FLAG_ORIGIN_INVALID)
 
     @property
-    def origin(self) -> AS:
-        return self.path[0]
+    def path_end_invalid(self) -> bool:
+        """Whether the first hop has no valid path-end record and one is expected."""
+        return bool(self.flags & FLAG_PATH_END_INVALID)
+
+    @property
+    def authenticated(self) -> bool:
+        """Whether the path is authenticated with BGPsec."""
+        return bool(self.flags & FLAG_AUTHENTICATED)
+
+    @property
+    def path(self) -> Tuple[AS, ...]:
+        if self._path is None:
+            suffix = []
+            route = self
+            while route._path is None:
+                suffix.append(route.last_hop)
+                assert route.prev is not None
+                route = route.prev
+            self._path = route._path + tuple(reversed(suffix))
+        return self._path
 
     @property
     def first_hop(self) -> AS:
+        if self.prev is not None:
+            return self.prev.last_hop
         return self.path[-2]
 
     @property
     def final(self) -> AS:
-        return self.path[-1]
+        return self.last_hop
 
     def contains_cycle(self) -> bool:
-        return len(self.path) != len(set(self.path))
+        return bool(self.flags & FLAG_CONTAINS_CYCLE)
 
     def __str__(self) -> str:
         return ','.join((str(asys.as_id) for asys in self.path))
@@ -196,3 +287,7 @@ class RoutingPolicy(abc.ABC):
     @abc.abstractmethod
     def forward_to(self, route: Route, relation: Relation) -> bool:
         pass
+
+    def forward_to_relations(self, route: Route) -> FrozenSet[Relation]:
+        """The set of neighbor relations a route should be forwarded to."""
+        return frozenset(relation for relation in Relation if self.forward_to(route, relation))
@@ -1,5 +1,6 @@
 import click
 import networkx as nx
+import numpy as np
 import random
 
 import bgpsecsim.as_graph as as_graph
@@ -7,6 +8,7 @@ import bgpsecsim.experiments as experiments
 import bgpsecsim.graphs as graphs
 import bgpsecsim.routing_policy as routing_policy
 from bgpsecsim.as_graph import ASGraph
+from bgpsecsim.asys import Relation
 
 @click.group()
 def cli():
@@ -29,6 +31,76 @@ def check_graph(as_rel_file):
     else:
         print("Graph has no cycles")
 
+@cli.command()
+@click.argument('as-rel-file')
+def check_connectivity(as_rel_file):
+    nx_graph = as_graph.parse_as_rel_file(as_rel_file)
+    graph = ASGraph(nx_graph)
+    print("Loaded graph")
+
+    asyss = list(graph.asyss.values())
+    n = len(asyss)
+    index = { asys.as_id: i for i, asys in enumerate(asyss) }
+
+    # Provider -> customer edges, keyed by dense index. An AS's customer cone is its set of
+    # descendants in this graph.
+    p2c_graph = nx.DiGraph()
+    p2c_graph.add_nodes_from(range(n))
+    for i, asys in enumerate(asyss):
+        for neighbor, relation in asys.neighbors.items():
+            if relation == Relation.CUSTOMER:
+                p2c_graph.add_edge(i, index[neighbor.as_id])
+
+    condensed = nx.condensation(p2c_graph)
+    order = list(nx.topological_sort(condensed))
+    members_of = { comp: np.fromiter(condensed.nodes[comp]['members'], dtype=np.int64)
+                   for comp in order }
+
+    # Reachability sets are bit-packed uint64 rows, one bit per AS. Dense N-by-N byte matrices
+    # would run to gigabytes on a full CAIDA snapshot; packed rows are 64x smaller and set
+    # union becomes a vectorized OR.
+    #
+    # Customer cones are computed bottom-up over the condensation in one sweep: a component's
+    # cone is its own members plus the union of its customers' cones, so the work is one row
+    # OR per condensation edge instead of one full BFS per source. The p2c graph should be
+    # acyclic, but condensing first keeps the sweep well-defined if it is not.
+    n_words = (n + 63) // 64
+    cone = np.zeros((n, n_words), dtype=np.uint64)
+    scc_cone = np.zeros((condensed.number_of_nodes(), n_words), dtype=np.uint64)
+    for comp in reversed(order):
+        members = members_of[comp]
+        row = scc_cone[comp]
+        np.bitwise_or.at(row, members >> 6, np.uint64(1) << (members & 63).astype(np.uint64))
+        for succ in condensed.successors(comp):
+            row |= scc_cone[succ]
+        cone[members] = row
+
+    # Under valley-free routing an AS reaches its own customer cone, its peers' customer cones,
+    # and everything its providers reach.
+    reach = cone.copy()
+    for i, asys in enumerate(asyss):
+        for neighbor, relation in asys.neighbors.items():
+            if relation == Relation.PEER:
+                reach[i] |= cone[index[neighbor.as_id]]
+
+    # The provider climb is a second sweep over the condensation, providers before customers.
+    scc_reach = np.zeros_like(scc_cone)
+    for comp in order:
+        row = scc_reach[comp]
+        for member in members_of[comp]:
+            row |= reach[member]
+        for pred in condensed.predecessors(comp):
+            row |= scc_reach[pred]
+        reach[members_of[comp]] = row
+
+    counts = as_graph.matrix_bit_counts(reach)
+    n_full = int((counts == n).sum())
+    print(f"{n_full} / {n} ASs can reach the entire graph")
+    if n_full == n:
+        print("Graph is fully connected under valley-free routing")
+    else:
+        print(f"Smallest reachable set covers {int(counts.min())} / {n} ASs")
+
 @cli.command()
 @click.argument('as-rel-file')
 @click.argument('origin-asn', type=int)
@@ -1,8 +1,19 @@
-from typing import Callable, Generator, Optional
+from typing import Callable, FrozenSet, Generator, Optional
 
 from bgpsecsim.asys import Relation, Route, RoutingPolicy
 
 class DefaultPolicy(RoutingPolicy):
+    def __init__(self):
+        # forward_to depends only on the relation the route was learned over, so the answers for
+        # all outbound relations can be precomputed per inbound relation. Subclasses overriding
+        # forward_to must override forward_to_relations as well.
+        self._forward_rels = {
+            first_hop_rel: frozenset(
+                relation for relation in Relation
+                if first_hop_rel == Relation.CUSTOMER or relation == Relation.CUSTOMER)
+            for first_hop_rel in Relation
+        }
+
     def accept_route(self, route: Route) -> bool:
         return not route.contains_cycle()
 
@@ -26,6 +37,12 @@ class DefaultPolicy(RoutingPolicy):
 
         return first_hop_rel == Relation.CUSTOMER or relation == Relation.CUSTOMER
 
+    def forward_to_relations(self, route: Route) -> FrozenSet[Relation]:
+        first_hop_rel = route.final.get_relation(route.first_hop)
+        assert first_hop_rel is not None
+
+        return self._forward_rels[first_hop_rel]
+
     def preference_rules(self) -> Generator[Callable[[Route], int], None, None]:
         # 1. Local preferences
         def local_pref(route):